@@ -10,6 +10,7 @@ import pandas as pd
 from src.utils.batch_processor import process_batch
 from src.services.input_data_service import InputDataService
 from src.utils.config_validator import ConfigValidator
+from src.utils.progress_tracker import existing_logo_ids
 from src.config import CONFIG
 
 class LogoScraper:
@@ -72,17 +73,13 @@ class LogoScraper:
             return df
             
         initial_count = len(df)
-        existing_ids = []
         
-        # Check which IDs already have logo files
-        for _, row in df.iterrows():
-            logo_path = os.path.join(self.output_folder, f"{row['ID']}.png")
-            if os.path.exists(logo_path):
-                existing_ids.append(str(row['ID']))
+        # Collect the IDs that already have logo files with a single directory scan
+        has_logo = df['ID'].astype(str).isin(existing_logo_ids(self.output_folder))
         
-        if existing_ids:
+        if has_logo.any():
             # Filter out existing logos
-            df_filtered = df[~df['ID'].astype(str).isin(existing_ids)]
+            df_filtered = df[~has_logo]
             filtered_count = len(df_filtered)
             skipped_count = initial_count - filtered_count
             
@@ -37,17 +37,17 @@ class ClearbitService:
             else:
                 # Move expected failures to info
                 if response.status_code in (403, 404):
-                    logging.info(f"ClearbitService: Non-200 response for {domain} (status {response.status_code})")
+                    logging.info("ClearbitService: Non-200 response for %s (status %s)", domain, response.status_code)
                 else:
-                    logging.warning(f"ClearbitService: Unexpected non-200 response for {domain} (status {response.status_code})")
+                    logging.warning("ClearbitService: Unexpected non-200 response for %s (status %s)", domain, response.status_code)
         except requests.exceptions.Timeout:
-            logging.info(f"ClearbitService: Timeout for {domain}")
+            logging.info("ClearbitService: Timeout for %s", domain)
             return None
         except requests.exceptions.ConnectionError:
-            logging.info(f"ClearbitService: Connection error for {domain}")
+            logging.info("ClearbitService: Connection error for %s", domain)
             return None
         except Exception as e:
-            logging.error(f"ClearbitService: Unexpected error for {domain}: {e}")
+            logging.error("ClearbitService: Unexpected error for %s: %s", domain, e)
             return None
         return None
         
@@ -26,5 +26,5 @@ class DefaultService:
         try:
             return create_default_logo(company_name)
         except Exception as e:
-            logging.error(f"Error creating default logo for {company_name}: {str(e)}")
+            logging.error("Error creating default logo for %s: %s", company_name, e)
         return None
\ No newline at end of file
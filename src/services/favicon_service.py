@@ -42,9 +42,9 @@ class FaviconService:
                     best_size = len(response.content)
                     best_source = "DuckDuckGo"
         except requests.exceptions.ConnectionError as e:
-            logging.error(f"Unrecoverable DNS/domain error for {domain} (DuckDuckGo): {str(e)}")
+            logging.error("Unrecoverable DNS/domain error for %s (DuckDuckGo): %s", domain, e)
         except requests.exceptions.RequestException as e:
-            logging.warning(f"Recoverable HTTP error for {domain} (DuckDuckGo): {str(e)}")
+            logging.warning("Recoverable HTTP error for %s (DuckDuckGo): %s", domain, e)
         # Try Google S2
         try:
             google_url = f"https://www.google.com/s2/favicons?domain={domain}"
@@ -55,12 +55,12 @@ class FaviconService:
                     best_size = len(response.content)
                     best_source = "Google S2"
         except requests.exceptions.ConnectionError as e:
-            logging.error(f"Unrecoverable DNS/domain error for {domain} (Google S2): {str(e)}")
+            logging.error("Unrecoverable DNS/domain error for %s (Google S2): %s", domain, e)
         except requests.exceptions.RequestException as e:
-            logging.warning(f"Recoverable HTTP error for {domain} (Google S2): {str(e)}")
+            logging.warning("Recoverable HTTP error for %s (Google S2): %s", domain, e)
         if best_logo:
             # Log the size and source for performance analysis
-            logging.info(f"FaviconService: Successfully retrieved logo for {domain} from {best_source} (size: {best_size} bytes)")
+            logging.info("FaviconService: Successfully retrieved logo for %s from %s (size: %s bytes)", domain, best_source, best_size)
             return best_logo, best_source, best_size
         return None, None, None
 
@@ -6,23 +6,28 @@ import os
 import signal
 import time
 from multiprocessing import Pool
+from multiprocessing.util import Finalize
 import pandas as pd
 from src.utils.company_processor import CompanyProcessor
 from src.config import CONFIG
 
-def init_worker():
-    """Initialize worker process to ignore SIGINT."""
+# Tasks a worker handles before it is replaced, bounding per-worker memory growth
+MAX_TASKS_PER_CHILD = 256
+
+# Per-worker processor, reused across tasks so HTTP sessions and font caches stay warm
+_processor = None
+
+def init_worker(output_folder):
+    """Initialize worker process to ignore SIGINT and create its CompanyProcessor."""
+    global _processor
     signal.signal(signal.SIGINT, signal.SIG_IGN)
+    _processor = CompanyProcessor(output_folder)
+    Finalize(_processor, _processor.cleanup, exitpriority=10)
 
-def process_company_wrapper(args):
+def process_company_wrapper(row):
     """Wrapper function for processing a single company in parallel."""
-    row, output_folder = args
-    processor = CompanyProcessor(output_folder)
-    try:
-        success, source = processor.process_company(row)
-        return str(row['ID']), success, source
-    finally:
-        processor.cleanup()
+    success, source = _processor.process_company(row)
+    return str(row['ID']), success, source
 
 def process_batch(companies_df: pd.DataFrame, output_folder: str,
                  num_processes: int = None, batch_idx: int = 1, total_batches: int = 1,
@@ -46,14 +51,15 @@ def process_batch(companies_df: pd.DataFrame, output_folder: str,
         num_processes = min(os.cpu_count() - 1 or 1, CONFIG.get('MAX_PROCESSES', 8))
     
     # Prepare arguments for parallel processing
-    process_args = [(row, output_folder) for _, row in companies_df.iterrows()]
+    process_args = [row for _, row in companies_df.iterrows()]
 
     results = []
     total = len(process_args)
     success_count = 0
     fail_count = 0
 
-    with Pool(num_processes, initializer=init_worker) as pool:
+    with Pool(num_processes, initializer=init_worker, initargs=(output_folder,),
+              maxtasksperchild=MAX_TASKS_PER_CHILD) as pool:
         # Instead of using tqdm for batch progress, we'll use simple print statements
         # to avoid conflicts with the main progress bar
         print(f"  Processing batch {batch_idx}/{total_batches} ({total} companies)...")
@@ -72,6 +78,11 @@ def process_batch(companies_df: pd.DataFrame, output_folder: str,
                 status_emoji = "🟩" if rate >= 90 else "🟨" if rate >= 50 else "🟥"
                 print(f"    {status_emoji} Progress: {completed}/{total} ({rate:.1f}% success)")
         
+        # Let workers exit normally so their Finalize hooks close HTTP sessions;
+        # leaving the with block alone would terminate() them mid-shutdown
+        pool.close()
+        pool.join()
+
         batch_end_time = time.time()
         batch_duration = batch_end_time - batch_start_time
           # Record batch timing for ETA calculation
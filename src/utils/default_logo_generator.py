@@ -4,8 +4,9 @@ This module handles the generation of default logos when no logo can be found on
 Includes support for international characters and different writing systems.
 """
 
+import functools
+import hashlib
 import logging
-import random
 import unicodedata
 from io import BytesIO
 from PIL import Image, ImageDraw
@@ -16,65 +17,62 @@ from src.utils.text_renderer import (
 )
 from src.config import CONFIG
 
-# def rounded_rectangle(draw, xy, radius, fill):
-#     """Draw a rounded rectangle."""
-#     x1, y1, x2, y2 = xy
-#     # Draw main rectangle
-#     draw.rectangle([x1+radius, y1, x2-radius, y2], fill=fill)
-#     draw.rectangle([x1, y1+radius, x2, y2-radius], fill=fill)
-#     # Draw corners
-#     draw.pieslice([x1, y1, x1+radius*2, y1+radius*2], 180, 270, fill=fill)
-#     draw.pieslice([x2-radius*2, y1, x2, y1+radius*2], 270, 360, fill=fill)
-#     draw.pieslice([x1, y2-radius*2, x1+radius*2, y2], 90, 180, fill=fill)
-#     draw.pieslice([x2-radius*2, y2-radius*2, x2, y2], 0, 90, fill=fill)
+# Professional background colors for default logos
+BACKGROUND_COLORS = [
+    (52, 152, 219),    # Blue
+    (46, 204, 113),    # Green
+    (155, 89, 182),    # Purple
+    (52, 73, 94),      # Dark Blue
+    (41, 128, 185),    # Medium Blue
+    (39, 174, 96),     # Medium Green
+    (142, 68, 173),    # Deep Purple
+    (41, 58, 74),      # Navy Blue
+    (44, 62, 80),      # Dark Navy
+    (19, 106, 138),    # Ocean Blue
+]
 
-def get_background_color():
-    """Get a professional background color."""
-    colors = [
-        (52, 152, 219),    # Blue
-        (46, 204, 113),    # Green
-        (155, 89, 182),    # Purple
-        (52, 73, 94),      # Dark Blue
-        (41, 128, 185),    # Medium Blue
-        (39, 174, 96),     # Medium Green
-        (142, 68, 173),    # Deep Purple
-        (41, 58, 74),      # Navy Blue
-        (44, 62, 80),      # Dark Navy
-        (19, 106, 138),    # Ocean Blue
-    ]
-    return random.choice(colors)
+def get_background_color(company_name):
+    """Get a professional background color, chosen deterministically from the company name.
+
+    A stable hash (unlike the built-in, per-process salted hash()) keeps the color
+    the same across runs and worker processes, so regenerated logos don't change.
+    """
+    digest = hashlib.blake2s(company_name.encode('utf-8'), digest_size=4).digest()
+    return BACKGROUND_COLORS[int.from_bytes(digest, 'little') % len(BACKGROUND_COLORS)]
 
 def has_wide_chars(text):
     """Check if text contains any fullwidth or wide characters"""
     return any(unicodedata.east_asian_width(c) in ('W','F') for c in text)
 
+@functools.lru_cache(maxsize=4096)
 def create_default_logo(company_name):
-    """Create a default logo for a company using their name."""
+    """Create a default logo for a company using their name.
+
+    The output depends only on the name, so PNG bytes are cached per name and
+    duplicate company names are rendered once per process.
+    """
     if not company_name:
         return None
 
     try:
         size = CONFIG['OUTPUT_SIZE']
-        # Create base image
-        img = Image.new('RGBA', (size, size), (255, 255, 255, 0))
+        # Create base image already filled with the background color
+        background_color = get_background_color(company_name)
+        img = Image.new('RGBA', (size, size), background_color)
         draw = ImageDraw.Draw(img)
         
         # Detect script to optimize font and layout
         script = detect_script(company_name)
-        logging.info(f"Detected script for '{company_name}': {script}")
+        logging.info("Detected script for '%s': %s", company_name, script)
         
         # Get initial font with script-specific optimization using our enhanced font loading
         font_size = int(size * 0.4)
         font = load_font_with_fallback(script, font_size)
         
         if not font:
-            logging.error(f"No suitable font found for script: {script}")
+            logging.error("No suitable font found for script: %s", script)
             return None
 
-        # Draw background
-        background_color = get_background_color()
-        draw.rectangle([0, 0, size, size], fill=background_color)
-
         # Calculate text area
         margin = int(size * 0.04)
         max_text_width = size - (2 * margin)
@@ -122,9 +120,10 @@ def create_default_logo(company_name):
                 
                 lines = split_into_lines(company_name, max_lines)
             
-            # Calculate appropriate font size for the lines
-            max_line_height = max_text_height / (len(lines) * 1.2)
-            line_font_size = find_font_size_for_lines(draw, lines, font, max_text_width, max_line_height)
+            # Calculate appropriate font size for the lines; the height limit applies to
+            # the whole block of lines, keeping 20% of the text area free
+            max_block_height = max_text_height / 1.2
+            line_font_size = find_font_size_for_lines(draw, lines, font, max_text_width, max_block_height)
             
             if line_font_size:
                 # Successfully fit text on multiple lines
@@ -159,5 +158,5 @@ def create_default_logo(company_name):
         return img_byte_arr.getvalue()
 
     except Exception as e:
-        logging.error(f"Error creating default logo for {company_name}: {str(e)}")
+        logging.error("Error creating default logo for %s: %s", company_name, e)
         return None
\ No newline at end of file
@@ -7,12 +7,18 @@ Recent changes:
 - The upscaling ratio limit has been removed; upscaling is only limited by the configured output dimensions.
 """
 
-import logging
 import os
+import struct
 from io import BytesIO
-from PIL import Image, UnidentifiedImageError
+from PIL import IcoImagePlugin, Image, UnidentifiedImageError
 from src.config import CONFIG
 
+# ICO files start with a reserved zero word followed by image type 1
+ICO_MAGIC = b'\x00\x00\x01\x00'
+
+# PNG signature; the IHDR chunk with width and height always follows it
+PNG_MAGIC = b'\x89PNG\r\n\x1a\n'
+
 # Custom Exceptions
 class ImageProcessingError(Exception):
     """Base class for image processing errors."""
@@ -35,7 +41,7 @@ class ImageResizingError(ImageProcessingError):
     pass
 
 class ImageSaveError(ImageProcessingError):
-    """Error during image saving or verification."""
+    """Error during image saving."""
     pass
 
 
@@ -54,7 +60,6 @@ def save_standardized_logo(image_data, output_path):
     # No top-level try-except here; specific exceptions from helpers will propagate.
     # Logging of these errors will be handled by the caller (e.g., CompanyProcessor)
     img = validate_and_load_image(image_data, output_path)
-    img = convert_to_rgb(img, output_path)
     new_img = create_standardized_image(img, output_path)
     save_final_image(new_img, output_path)
     # If all steps succeed, implicitly returns None, indicating success.
@@ -66,75 +71,71 @@ def validate_and_load_image(image_data, output_path):
     Raises InvalidImageDataError or ImageTooSmallError on failure.
     At least one dimension (width or height) must be >= MIN_SOURCE_SIZE.
     """
+    min_source_size = CONFIG.get('MIN_SOURCE_SIZE', 50) # Default if not in config
+
+    if image_data[:4] == ICO_MAGIC:
+        return load_largest_ico_frame(image_data, output_path, min_source_size)
+
+    # Reject undersized PNGs straight from the IHDR header, before handing the data to PIL
+    if image_data[:8] == PNG_MAGIC and image_data[12:16] == b'IHDR' and len(image_data) >= 24:
+        width, height = struct.unpack('>II', image_data[16:24])
+        check_source_size(width, height, output_path, min_source_size)
+
     try:
+        # Image.open only parses the header; pixel data is decoded once, lazily,
+        # by the first operation that needs it (convert/resize).
         img = Image.open(BytesIO(image_data))
-        img.load() # Ensure image data is loaded
     except UnidentifiedImageError as e:
         raise InvalidImageDataError(f"Cannot identify image file for {output_path}: {str(e)}") from e
     except Exception as e: # Catch other PIL errors
         raise InvalidImageDataError(f"Invalid image data for {output_path}: {str(e)}") from e
 
     # Check source image dimensions
-    min_source_size = CONFIG.get('MIN_SOURCE_SIZE', 50) # Default if not in config
-    if img.width < min_source_size and img.height < min_source_size:
+    check_source_size(img.width, img.height, output_path, min_source_size)
+
+    if img.format == 'JPEG':
+        # Let libjpeg decode at a reduced DCT scale, never below twice the output size
+        output_size = CONFIG.get('OUTPUT_SIZE', 256)
+        img.draft('RGB', (output_size * 2, output_size * 2))
+    return img
+
+def check_source_size(width, height, output_path, min_source_size):
+    """
+    Check that at least one source dimension reaches MIN_SOURCE_SIZE.
+    Raises ImageTooSmallError otherwise.
+    """
+    if width < min_source_size and height < min_source_size:
         raise ImageTooSmallError(
-            f"Source image for {output_path} is too small ({img.width}x{img.height}). "
+            f"Source image for {output_path} is too small ({width}x{height}). "
             f"Both width and height are below minimum {min_source_size}px."
         )
-        
-    # Handle ICO format specifically for size checks
-    if img.format == 'ICO':
-        # For ICO, Pillow loads the best available size by default with img.load()
-        # We re-check the loaded image's size.
-        if img.width < min_source_size and img.height < min_source_size:
-            try:
-                if hasattr(img, '_ico'):
-                    sizes = img._ico.sizes()
-                    if sizes:
-                        largest_ico_size = max(sizes, key=lambda t: t[0])
-                        if largest_ico_size[0] >= min_source_size or largest_ico_size[1] >= min_source_size:
-                            pass # Acceptable size exists
-                        else:
-                            raise ImageTooSmallError(
-                                f"ICO image {output_path} best size ({img.width}x{img.height}) is below minimum {min_source_size}px. "
-                                f"Largest internal ICO size also too small: {largest_ico_size[0]}x{largest_ico_size[1]}px."
-                            )
-            except Exception as e:
-                logging.debug(f"Could not further interrogate ICO sizes for {output_path}: {e}")
-                if img.width < min_source_size and img.height < min_source_size:
-                    raise ImageTooSmallError(
-                        f"ICO image {output_path} ({img.width}x{img.height}) is below minimum {min_source_size}px after initial load."
-                    )
-    return img
 
-def convert_to_rgb(img, output_path):
+def load_largest_ico_frame(image_data, output_path, min_source_size):
     """
-    Convert image to RGB format.
-    Raises ImageConversionError on failure.
+    Decode only the largest frame of an ICO file.
+    
+    The frame sizes are read from the ICO directory without decoding any
+    pixels, so undersized icons are rejected before any decode happens.
+    Raises InvalidImageDataError or ImageTooSmallError on failure.
     """
     try:
-        if img.mode == 'RGBA':
-            # Create a white background for transparency
-            background = Image.new('RGB', img.size, (255, 255, 255))
-            # Paste the RGBA image onto the white background using the alpha channel as mask
-            background.paste(img, mask=img.split()[3]) 
-            return background
-        elif img.mode == 'P':
-            # Handle palette images with potential transparency
-            if 'transparency' in img.info:
-                # Convert palette image with transparency to RGBA first, then to RGB
-                img = img.convert('RGBA')
-                background = Image.new('RGB', img.size, (255, 255, 255))
-                background.paste(img, mask=img.split()[3])
-                return background
-            else:
-                # No transparency, direct conversion to RGB
-                return img.convert('RGB')
-        elif img.mode != 'RGB':
-            return img.convert('RGB')
-        return img # Already RGB
+        ico = IcoImagePlugin.IcoFile(BytesIO(image_data))
+        sizes = ico.sizes()
     except Exception as e:
-        raise ImageConversionError(f"Failed to convert image mode '{img.mode}' to RGB for {output_path}: {str(e)}") from e
+        raise InvalidImageDataError(f"Invalid ICO data for {output_path}: {str(e)}") from e
+    if not sizes:
+        raise InvalidImageDataError(f"ICO file for {output_path} contains no images")
+
+    width, height = max(sizes, key=lambda size: size[0] * size[1])
+    if width < min_source_size and height < min_source_size:
+        raise ImageTooSmallError(
+            f"ICO image {output_path} largest size ({width}x{height}) is below minimum {min_source_size}px."
+        )
+
+    try:
+        return ico.getimage((width, height))
+    except Exception as e:
+        raise InvalidImageDataError(f"Invalid ICO data for {output_path}: {str(e)}") from e
 
 def create_standardized_image(img, output_path):
     """
@@ -144,23 +145,30 @@ def create_standardized_image(img, output_path):
     - Aspect ratio preservation - Maintains the original image proportions
     - White background standardization - Ensures consistency across all outputs
     - Anti-aliased resizing - Uses LANCZOS resampling for highest quality downsampling
+    - Resize before flattening - The source is resized in its own mode and pasted onto
+      the white canvas using its own alpha channel as the mask, so transparency is
+      flattened in a single blend at the target size
     - Centered positioning - Places the image in the center of the standardized canvas
     - Upscaling prevention - (Removed: now upscaling is only limited by configured dimensions)
     
     Args:
-        img: PIL Image object to standardize.
+        img: PIL Image object to standardize, in any mode.
         output_path: Path where the image will be saved (for logging purposes).
         
     Returns:
-        PIL Image: A new standardized image.
+        PIL Image: A new standardized RGB image.
     Raises:
         ImageResizingError: If processing failed, e.g., due to Pillow errors.
     """
     output_size = CONFIG.get('OUTPUT_SIZE', 256) # Default if not in config
     try:
-        # Create new image with white background
-        new_img = Image.new('RGB', (output_size, output_size), (255, 255, 255))
-        
+        # Palette and bilevel images can only be resized with nearest-neighbour
+        # sampling, so widen them first (keeping any transparency)
+        if img.mode == 'P':
+            img = img.convert('RGBA' if 'transparency' in img.info else 'RGB')
+        elif img.mode == '1':
+            img = img.convert('L')
+
         # Calculate resize dimensions
         ratio = min(output_size / img.width, output_size / img.height)
         new_width = int(img.width * ratio)
@@ -170,9 +178,18 @@ def create_standardized_image(img, output_path):
         # Resize and center image using high-quality downsampling
         resized_img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
         
+        # Create new image with white background
+        new_img = Image.new('RGB', (output_size, output_size), (255, 255, 255))
+        
         x_offset = (output_size - new_width) // 2
         y_offset = (output_size - new_height) // 2
-        new_img.paste(resized_img, (x_offset, y_offset))
+        if resized_img.mode in ('RGBA', 'LA'):
+            # The image doubles as its own mask: paste blends by its alpha channel,
+            # flattening transparency onto the white background
+            new_img.paste(resized_img, (x_offset, y_offset), resized_img)
+        else:
+            # Other modes are converted to RGB by paste
+            new_img.paste(resized_img, (x_offset, y_offset))
         
         return new_img
         
@@ -182,19 +199,14 @@ def create_standardized_image(img, output_path):
 
 def save_final_image(img, output_path):
     """
-    Save the final image and verify it.
+    Save the final image as PNG.
     Raises ImageSaveError on failure.
+    
+    The file is not re-opened for verification: Pillow's PNG encoder raises
+    on any encoding or write failure, so a successful save is a valid PNG.
     """
     try:
         # Save with high quality and optimization for PNG
         img.save(output_path, 'PNG', quality=CONFIG.get('PNG_QUALITY', 95), optimize=True)
-        
-        # Verify the saved file can be opened and is a valid image
-        with Image.open(output_path) as verify_img:
-            verify_img.verify() # Verifies image integrity
-            # Optionally, check if it's actually a PNG
-            if verify_img.format != 'PNG':
-                raise ImageSaveError(f"Verification failed for {output_path}: Saved file is not PNG (format: {verify_img.format})")
-
     except Exception as e:
-        raise ImageSaveError(f"Failed to save or verify image at {output_path}: {str(e)}") from e
\ No newline at end of file
+        raise ImageSaveError(f"Failed to save image at {output_path}: {str(e)}") from e
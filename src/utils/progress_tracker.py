@@ -1,38 +1,234 @@
+import atexit
 import json
+import os
+import stat
+import tempfile
+
+try:
+    import orjson  # Optional: faster (de)serialization of large progress files
+except ImportError:
+    orjson = None
+
+def _dumps(data):
+    """Serialize data to JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode('utf-8')
+
+def _loads(raw):
+    """Deserialize JSON bytes."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def existing_logo_ids(logos_folder):
+    """Return the set of IDs that already have a '<ID>.png' logo in logos_folder.
+
+    Uses a single os.scandir pass; directory entries carry their name and
+    type, so no per-file stat or path joining is needed.
+    """
+    with os.scandir(logos_folder) as entries:
+        return {
+            entry.name[:-4] for entry in entries
+            if entry.name.endswith('.png') and entry.is_file()
+        }
+
+def _file_mode(path):
+    """Return path's permission bits, or the umask default for a new file."""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+# Every record written by ProgressTracker starts with these bytes
+_RECORD_PREFIX = _dumps({'id': None})[:6]
+
+def _is_snapshot(record):
+    """Check whether a parsed line is a whole-file {'completed': [...], 'failed': [...]} snapshot."""
+    return (
+        isinstance(record, dict) and 'id' not in record
+        and ('completed' in record or 'failed' in record)
+        and all(isinstance(record.get(key, []), list) for key in ('completed', 'failed'))
+    )
 
 class ProgressTracker:
-    """Track and persist progress of logo processing operations."""
+    """Track and persist progress of logo processing operations.
+
+    Progress is stored as an append-only NDJSON log with one
+    ``{"id": ..., "status": "completed" | "failed"}`` record per line, so
+    marking an ID is a short buffered append instead of a full rewrite.
+    The log stays open while the tracker is in use; appends are flushed every
+    ``flush_every`` marks, on ``flush()`` and when the tracker is closed
+    (``close()``, leaving a ``with`` block, or interpreter exit). ``sync()``
+    additionally forces the log to stable storage.
+
+    IDs are kept in sets for O(1) membership checks. If ``logos_folder`` is
+    given, IDs that already have a logo there are treated as completed.
+    """
+
+    # Rewrite the log on load when it holds this many lines per tracked entry
+    COMPACT_RATIO = 4
 
-    def __init__(self, progress_file='progress.json'):
+    def __init__(self, progress_file='progress.ndjson', flush_every=100, logos_folder=None):
         self.progress_file = progress_file
-        self.progress = {'completed': [], 'failed': []}
+        self.logos_folder = logos_folder
+        self._completed = set()
+        self._failed = set()
+        self._processed = set()
+        self._dirty = 0
+        self._flush_every = flush_every
+        self._log = None
         self.load_progress()
 
     def load_progress(self):
-        """Load progress from the progress file."""
+        """Load progress by replaying the progress log.
+
+        A final line without a trailing newline that starts like a record but
+        cannot be parsed was torn by a crash mid-write; it is dropped and the log compacted
+        so later appends start on a clean line. Any other unreadable line
+        raises ValueError and the file is left untouched. A snapshot in the
+        older ``{"completed": [...], "failed": [...]}`` format is read and
+        rewritten as a log.
+        """
+        self._completed = set()
+        self._failed = set()
+        by_status = {'completed': self._completed, 'failed': self._failed}
+        needs_compaction = False
+        line_count = 0
         try:
-            with open(self.progress_file, 'r') as f:
-                self.progress = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            self.progress = {'completed': [], 'failed': []}
+            with open(self.progress_file, 'rb') as f:
+                for line in f:
+                    line_count += 1
+                    try:
+                        record = _loads(line)
+                        if line_count == 1 and _is_snapshot(record):
+                            self._completed.update(record.get('completed', ()))
+                            self._failed.update(record.get('failed', ()))
+                            needs_compaction = True
+                            continue
+                        by_status[record['status']].add(record['id'])
+                    except (ValueError, KeyError, TypeError) as e:
+                        if line.endswith(b'\n') or not line.startswith(_RECORD_PREFIX):
+                            raise ValueError(
+                                f"{self.progress_file}:{line_count}: not a progress record; "
+                                f"refusing to rewrite the file"
+                            ) from e
+                    if not line.endswith(b'\n'):
+                        needs_compaction = True
+        except FileNotFoundError:
+            pass
+
+        entry_count = len(self._completed) + len(self._failed)
+        if needs_compaction or line_count > self.COMPACT_RATIO * max(entry_count, 1):
+            self.save_progress()
+        else:
+            self._open_log()
+
+        if self.logos_folder and os.path.isdir(self.logos_folder):
+            # Logos on disk are their own record; they are not written to the log
+            self._completed.update(existing_logo_ids(self.logos_folder))
+        # Union of completed and failed IDs, so is_processed is a single lookup
+        self._processed = self._completed | self._failed
+
+    def _open_log(self):
+        """(Re)open the append handle used for new records.
+
+        The handle is closed at interpreter exit unless close() runs first.
+        """
+        if self._log is not None:
+            self._log.close()
+        self._log = open(self.progress_file, 'ab', buffering=1 << 16)
+        atexit.unregister(self.close)
+        atexit.register(self.close)
+
+    def _append(self, id, status):
+        """Append one record to the log, flushing once enough have accumulated."""
+        if self._log is None:
+            # Closed earlier (e.g. by leaving a with block); reopen on demand
+            self._open_log()
+        self._log.write(_dumps({'id': id, 'status': status}) + b'\n')
+        self._dirty += 1
+        if self._dirty >= self._flush_every:
+            self.flush()
 
     def save_progress(self):
-        """Save progress to the progress file."""
-        with open(self.progress_file, 'w') as f:
-            json.dump(self.progress, f)
+        """Rewrite (compact) the progress log from the in-memory state.
+
+        The log is written to a temporary file first and atomically moved
+        into place, so a crash mid-write never leaves a truncated file behind.
+        """
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+        directory = os.path.dirname(os.path.abspath(self.progress_file))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            # mkstemp creates the file owner-only; keep the permissions the
+            # progress file has (or would get from open()) instead
+            os.chmod(tmp_path, _file_mode(self.progress_file))
+            with os.fdopen(fd, 'wb') as f:
+                # Sorted so the file is stable between saves and easy to diff
+                for status, ids in (('completed', self._completed), ('failed', self._failed)):
+                    for id in sorted(ids):
+                        f.write(_dumps({'id': id, 'status': status}) + b'\n')
+            os.replace(tmp_path, self.progress_file)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        finally:
+            self._open_log()
+        self._dirty = 0
+
+    def flush(self):
+        """Write any buffered records to the progress log."""
+        if self._dirty:
+            self._log.flush()
+            self._dirty = 0
+
+    def sync(self):
+        """Flush buffered records and fsync the progress log for durability."""
+        self.flush()
+        if self._log is None:
+            self._open_log()
+        os.fsync(self._log.fileno())
+
+    def close(self):
+        """Flush buffered records and release the progress log handle.
+
+        The tracker stays usable; the log is reopened by the next mark.
+        """
+        if self._log is not None:
+            self.flush()
+            self._log.close()
+            self._log = None
+        atexit.unregister(self.close)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
 
     def mark_completed(self, id):
         """Mark an ID as successfully processed."""
-        if id not in self.progress['completed']:
-            self.progress['completed'].append(id)
-            self.save_progress()
+        if id not in self._completed:
+            self._completed.add(id)
+            self._processed.add(id)
+            self._append(id, 'completed')
 
     def mark_failed(self, id):
         """Mark an ID as failed."""
-        if id not in self.progress['failed']:
-            self.progress['failed'].append(id)
-            self.save_progress()
+        if id not in self._failed:
+            self._failed.add(id)
+            self._processed.add(id)
+            self._append(id, 'failed')
 
     def is_processed(self, id):
         """Check if an ID has already been processed."""
-        return id in self.progress['completed'] or id in self.progress['failed']
\ No newline at end of file
+        return id in self._processed
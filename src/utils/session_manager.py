@@ -56,7 +56,7 @@ class SessionManager:
                 if response.status_code >= 500:
                     attempt += 1
                     if attempt < self.max_retries:
-                        logging.info(f"Got status code {response.status_code}, retrying ({attempt}/{self.max_retries})...")
+                        logging.info("Got status code %s, retrying (%s/%s)...", response.status_code, attempt, self.max_retries)
                         time.sleep(self.retry_delay * attempt)  # Progressive backoff
                         continue
                 
@@ -69,10 +69,10 @@ class SessionManager:
                 last_exception = e
                 
                 if attempt < self.max_retries:
-                    logging.info(f"Connection error: {str(e)}, retrying ({attempt}/{self.max_retries})...")
+                    logging.info("Connection error: %s, retrying (%s/%s)...", e, attempt, self.max_retries)
                     time.sleep(self.retry_delay * attempt)  # Progressive backoff
                 else:
-                    logging.error(f"Request failed after {self.max_retries} attempts: {str(e)}")
+                    logging.error("Request failed after %s attempts: %s", self.max_retries, e)
                     raise
         
         # If we get here, we've exhausted retries
@@ -4,6 +4,8 @@ This module handles text rendering functionality for logo generation with compre
 multilingual support for all writing systems and languages.
 """
 
+import bisect
+import functools
 import logging
 import os
 import platform
@@ -11,6 +13,18 @@ import unicodedata
 from PIL import ImageFont
 from src.config import CONFIG
 
+# Operating system name; invariant for the lifetime of the process
+_SYSTEM = platform.system()
+
+# Font paths that failed to load, so they are skipped on later lookups
+_MISSING_FONTS = set()
+
+# First loadable font path for each font priority list, keyed by tuple(try_fonts)
+_RESOLVED_FONTS = {}
+
+# Resolved font path for each script, filled in by font_for
+_SCRIPT_FONT_PATHS = {}
+
 # Define universal fonts that work well for multi-language support
 FONT_PRIORITIES = {
     'Windows': [
@@ -111,14 +125,14 @@ SPECIAL_FONT_PATHS = {
     }
 }
 
+@functools.lru_cache(maxsize=1)
 def get_system_font_directory():
-    """Get the system font directory based on the operating system."""
-    system = platform.system()
-    if system == 'Windows':
+    """Get the system font directory based on the operating system (computed once)."""
+    if _SYSTEM == 'Windows':
         return os.path.join(os.environ.get('WINDIR', 'C:\\Windows'), 'Fonts')
-    elif system == 'Darwin':  # macOS
+    elif _SYSTEM == 'Darwin':  # macOS
         return '/System/Library/Fonts'
-    elif system == 'Linux':
+    elif _SYSTEM == 'Linux':
         # Common font directories in Linux
         candidates = [
             '/usr/share/fonts',
@@ -132,6 +146,103 @@ def get_system_font_directory():
     else:
         return None
 
+# Scripts counted by detect_script; the order breaks ties between equal counts
+_SCRIPT_NAMES = (
+    'cyrillic',
+    'korean',  # Separate Korean from other CJK
+    'cjk',
+    'latin',
+    'arabic',
+    'devanagari',
+    'thai',
+    'hebrew',
+    'greek',
+    'turkish',
+    'other',
+)
+
+# Turkish-specific characters
+_TURKISH_CHARS = frozenset('ıİğĞüÜşŞöÖçÇ')
+
+# ASCII whitespace and punctuation, which detect_script ignores; every other
+# ASCII character counts as Latin
+_ASCII_SKIP = frozenset(
+    c for c in map(chr, range(0x80))
+    if c.isspace() or unicodedata.category(c).startswith('P')
+)
+
+# Sorted, non-overlapping (first, last, script) codepoint ranges for the common
+# blocks of each script. Characters outside these ranges are classified by
+# their Unicode name (see _script_from_name).
+_SCRIPT_RANGES = (
+    (0x00C0, 0x00D6, 'latin'),
+    (0x00D8, 0x00F6, 'latin'),
+    (0x00F8, 0x02AF, 'latin'),       # Latin-1, Extended-A/B, IPA
+    (0x0370, 0x03E1, 'greek'),
+    (0x03F0, 0x03FF, 'greek'),
+    (0x0400, 0x052F, 'cyrillic'),
+    (0x0590, 0x05FF, 'hebrew'),
+    (0x0600, 0x060A, 'arabic'),
+    (0x060C, 0x06FF, 'arabic'),
+    (0x0750, 0x077F, 'arabic'),
+    (0x08A0, 0x08FF, 'arabic'),
+    (0x0900, 0x097F, 'devanagari'),
+    (0x0E00, 0x0E7F, 'thai'),
+    (0x1100, 0x11FF, 'korean'),      # Hangul Jamo
+    (0x1E00, 0x1EFF, 'latin'),       # Latin Extended Additional
+    (0x1F00, 0x1FFF, 'greek'),       # Greek Extended
+    (0x3040, 0x312F, 'cjk'),         # Hiragana, Katakana, Bopomofo
+    (0x3130, 0x318F, 'korean'),      # Hangul Compatibility Jamo
+    (0x31A0, 0x31BF, 'cjk'),
+    (0x31F0, 0x31FF, 'cjk'),
+    (0x3400, 0x4DBF, 'cjk'),
+    (0x4E00, 0x9FFF, 'cjk'),
+    (0xA640, 0xA69F, 'cyrillic'),
+    (0xA722, 0xA76F, 'latin'),
+    (0xA771, 0xA787, 'latin'),
+    (0xA78B, 0xA7F1, 'latin'),
+    (0xA960, 0xA97F, 'korean'),
+    (0xAC00, 0xD7FF, 'korean'),      # Hangul Syllables, Jamo Extended-B
+    (0xF900, 0xFAFF, 'cjk'),
+    (0xFB1D, 0xFB4F, 'hebrew'),
+    (0xFB50, 0xFDFB, 'arabic'),
+    (0xFE70, 0xFEFE, 'arabic'),
+    (0x20000, 0x2A6DF, 'cjk'),
+)
+_SCRIPT_RANGE_STARTS = [first for first, _, _ in _SCRIPT_RANGES]
+
+def _script_from_name(char):
+    """Classify a non-ASCII character by its Unicode character name."""
+    name = unicodedata.name(char, '')
+    if 'HANGUL' in name:
+        return 'korean'
+    elif any(script in name for script in ('CJK', 'HIRAGANA', 'KATAKANA', 'BOPOMOFO')):
+        return 'cjk'
+    elif 'CYRILLIC' in name:
+        return 'cyrillic'
+    elif 'LATIN' in name:
+        return 'latin'
+    elif 'ARABIC' in name:
+        return 'arabic'
+    elif 'DEVANAGARI' in name:
+        return 'devanagari'
+    elif 'THAI' in name:
+        return 'thai'
+    elif 'HEBREW' in name:
+        return 'hebrew'
+    elif 'GREEK' in name:
+        return 'greek'
+    else:
+        return 'other'
+
+def _script_of(char):
+    """Classify a non-ASCII character: range table first, Unicode name otherwise."""
+    cp = ord(char)
+    i = bisect.bisect_right(_SCRIPT_RANGE_STARTS, cp) - 1
+    if i >= 0 and cp <= _SCRIPT_RANGES[i][1]:
+        return _SCRIPT_RANGES[i][2]
+    return _script_from_name(char)
+
 def detect_script(text):
     """
     Detect the dominant script used in a text to optimize font selection.
@@ -145,6 +256,8 @@ def detect_script(text):
     2. Korean script is processed separately from other CJK scripts due to its unique characteristics
     3. We apply a threshold-based approach (>20% non-Latin or >60% Latin) to handle mixed-script text
     4. Whitespace and punctuation are ignored to focus on meaningful characters
+    5. Characters are classified by codepoint range (_SCRIPT_RANGES), falling back to
+       their Unicode name only outside the common blocks
     
     Returns: 
         str: The detected script - one of: 'cyrillic', 'cjk', 'latin', 'arabic', 
@@ -154,72 +267,36 @@ def detect_script(text):
         return 'latin'
         
     # Count characters by script
-    counts = {
-        'cyrillic': 0,
-        'korean': 0,  # Separate Korean from other CJK
-        'cjk': 0,
-        'latin': 0,
-        'arabic': 0,
-        'devanagari': 0,
-        'thai': 0, 
-        'hebrew': 0,
-        'greek': 0,
-        'turkish': 0,
-        'other': 0
-    }
-    
-    # Turkish-specific characters
-    turkish_chars = set('ıİğĞüÜşŞöÖçÇ')
+    counts = dict.fromkeys(_SCRIPT_NAMES, 0)
     
     for char in text:
+        # ASCII fast path: everything except whitespace and punctuation is Latin
+        if char < '\x80':
+            if char not in _ASCII_SKIP:
+                counts['latin'] += 1
+            continue
+        
         # Skip whitespace and punctuation
         if char.isspace() or unicodedata.category(char).startswith('P'):
             continue
         
         # Check for Turkish special characters
-        if char in turkish_chars:
+        if char in _TURKISH_CHARS:
             counts['turkish'] += 1
             continue
-            
-        # Get character name and category
-        try:
-            name = unicodedata.name(char, '').upper()
-        except ValueError:
-            # If we can't get the Unicode name, consider it 'other'
-            counts['other'] += 1
-            continue
         
-        # Identify script
-        if 'HANGUL' in name:
-            counts['korean'] += 1
-        elif any(script in name for script in ('CJK', 'HIRAGANA', 'KATAKANA', 'BOPOMOFO')):
-            counts['cjk'] += 1
-        elif 'CYRILLIC' in name:
-            counts['cyrillic'] += 1
-        elif 'LATIN' in name or char.isascii():
-            counts['latin'] += 1
-        elif 'ARABIC' in name:
-            counts['arabic'] += 1
-        elif 'DEVANAGARI' in name:
-            counts['devanagari'] += 1
-        elif 'THAI' in name:
-            counts['thai'] += 1
-        elif 'HEBREW' in name:
-            counts['hebrew'] += 1
-        elif 'GREEK' in name:
-            counts['greek'] += 1
-        else:
-            counts['other'] += 1
+        # Identify script; Korean takes precedence over every other script, so
+        # the first Korean character decides the result
+        script = _script_of(char)
+        if script == 'korean':
+            return 'korean'
+        counts[script] += 1
     
     # Determine dominant script
     total = sum(counts.values())
     if total == 0:
         return 'latin'
     
-    # Special case handling for Korean
-    if counts['korean'] > 0:
-        return 'korean'
-    
     # Special case for Turkish: even just a few Turkish characters means we should use Turkish
     if counts['turkish'] > 1:
         return 'turkish'
@@ -237,13 +314,36 @@ def detect_script(text):
     else:
         return 'other'
 
-def get_font(size, try_fonts=None):
-    """Get a font of the specified size with support for international characters."""
-    system = platform.system()
-    
-    # Use system-specific font list if no fonts are specified
-    if try_fonts is None:
-        try_fonts = FONT_PRIORITIES.get(system, FONT_PRIORITIES['Windows'])
+@functools.lru_cache(maxsize=256)
+def _load_truetype(path, size):
+    """Load a TrueType font, memoized by (path, size).
+
+    Font objects are never modified after loading, so repeated lookups of the
+    same font and size (e.g. while searching for a fitting size) share one
+    parsed font instead of re-reading the font file. Failures are not cached.
+    """
+    return ImageFont.truetype(path, size)
+
+@functools.lru_cache(maxsize=4096)
+def _measure(font_path, size, text):
+    """Return the bounding box of text drawn at the origin, memoized by (font_path, size, text).
+
+    Equivalent to ImageDraw.textbbox((0, 0), text, font) on an RGB/RGBA canvas,
+    without re-running text layout for text that was already measured.
+    """
+    return _load_truetype(font_path, size).getbbox(text, mode='L')
+
+def _resolve_font_path(try_fonts, size):
+    """Return the path of the first font in try_fonts that loads, or None.
+
+    The result is cached per priority list, and paths that fail to load are
+    remembered so they are not probed again.
+    """
+    # Reuse the font this priority list resolved to on an earlier call
+    key = tuple(try_fonts)
+    font_path = _RESOLVED_FONTS.get(key)
+    if font_path is not None:
+        return font_path
     
     # Get system font directory
     fonts_dir = get_system_font_directory()
@@ -256,43 +356,103 @@ def get_font(size, try_fonts=None):
         else:
             font_path = os.path.join(fonts_dir, font_name)
         
+        if font_path in _MISSING_FONTS:
+            continue
         try:
-            return ImageFont.truetype(font_path, size)
+            _load_truetype(font_path, size)
         except Exception as e:
-            logging.debug(f"Could not load font {font_name}: {str(e)}")
+            logging.debug("Could not load font %s: %s", font_name, e)
+            _MISSING_FONTS.add(font_path)
             continue
-    
-    # No font could be loaded; report error
-    logging.error("No suitable TrueType font found; please install required fonts or adjust FONT_PRIORITIES")
+        _RESOLVED_FONTS[key] = font_path
+        return font_path
     return None
 
+def _resolve_script_font_path(script, size):
+    """Return the path of the best available font for a script, or None.
+
+    Tries, in order: the exact SPECIAL_FONT_PATHS for problematic scripts like
+    Turkish and Korean, the script's SCRIPT_SPECIFIC_FONTS, then FONT_PRIORITIES.
+    """
+    if script in SPECIAL_FONT_PATHS and _SYSTEM in SPECIAL_FONT_PATHS[script]:
+        for font_path in SPECIAL_FONT_PATHS[script][_SYSTEM]:
+            try:
+                if os.path.exists(font_path):
+                    _load_truetype(font_path, size)
+                    logging.info("Loading specialized font for %s: %s", script, font_path)
+                    return font_path
+            except Exception as e:
+                logging.debug("Failed to load specialized font %s: %s", font_path, e)
+    
+    if script in SCRIPT_SPECIFIC_FONTS:
+        font_path = _resolve_font_path(SCRIPT_SPECIFIC_FONTS[script], size)
+        if font_path:
+            return font_path
+    
+    return _resolve_font_path(FONT_PRIORITIES.get(_SYSTEM, FONT_PRIORITIES['Windows']), size)
+
+def font_for(script, size):
+    """Get the font for a script at the given size.
+
+    The font path for each script is resolved once per process (see
+    _resolve_script_font_path); later calls are a dict lookup plus the
+    (path, size) font cache.
+    """
+    font_path = _SCRIPT_FONT_PATHS.get(script)
+    if font_path is None:
+        font_path = _resolve_script_font_path(script, size)
+        if font_path is None:
+            logging.error("No suitable TrueType font found; please install required fonts or adjust FONT_PRIORITIES")
+            return None
+        _SCRIPT_FONT_PATHS[script] = font_path
+    return _load_truetype(font_path, size)
+
+def get_font(size, try_fonts=None):
+    """Get a font of the specified size with support for international characters."""
+    # Use system-specific font list if no fonts are specified
+    if try_fonts is None:
+        try_fonts = FONT_PRIORITIES.get(_SYSTEM, FONT_PRIORITIES['Windows'])
+    
+    font_path = _resolve_font_path(try_fonts, size)
+    if font_path is None:
+        # No font could be loaded; report error
+        logging.error("No suitable TrueType font found; please install required fonts or adjust FONT_PRIORITIES")
+        return None
+    return _load_truetype(font_path, size)
+
 def get_script_specific_font(script, size):
     """Get a font that's optimized for a specific script."""
     if script in SCRIPT_SPECIFIC_FONTS:
         # Try script-specific fonts first
-        font = get_font(size, SCRIPT_SPECIFIC_FONTS[script])
-        if font:
-            return font
+        font_path = _resolve_font_path(SCRIPT_SPECIFIC_FONTS[script], size)
+        if font_path:
+            return _load_truetype(font_path, size)
     
     # Fall back to general font selection if we couldn't find a script-specific font
     return get_font(size)
 
 def load_font_with_fallback(script, size):
     """Load a font with special handling for problematic scripts like Turkish and Korean"""
-    system = platform.system()
-    
-    # Try to load a specific font for problematic scripts
-    if script in SPECIAL_FONT_PATHS and system in SPECIAL_FONT_PATHS[script]:
-        for font_path in SPECIAL_FONT_PATHS[script][system]:
-            try:
-                if os.path.exists(font_path):
-                    logging.info(f"Loading specialized font for {script}: {font_path}")
-                    return ImageFont.truetype(font_path, size)
-            except Exception as e:
-                logging.debug(f"Failed to load specialized font {font_path}: {str(e)}")
-    
-    # Fall back to regular font loading
-    return get_script_specific_font(script, size)
+    return font_for(script, size)
+
+def _largest_fitting_size(start_size, min_size, fits):
+    """Binary search the candidate sizes (start_size down to min_size in steps of 4).
+
+    ``fits`` must be monotonic - if a size fits, every smaller size fits too - so
+    only O(log n) candidates need to be laid out instead of scanning every step.
+    Returns the largest fitting size, or None if even min_size does not fit.
+    """
+    lo, hi = 0, (start_size - min_size) // 4
+    best = None
+    while lo <= hi:
+        mid = (lo + hi) // 2
+        size = start_size - mid * 4
+        if fits(size):
+            best = size
+            hi = mid - 1
+        else:
+            lo = mid + 1
+    return best
 
 def adjust_font_size(draw, text, font, max_width, max_height, start_size=None, min_size=None):
     """Find the largest font size that fits text within given dimensions."""
@@ -311,52 +471,61 @@ def adjust_font_size(draw, text, font, max_width, max_height, start_size=None, m
         # If we still don't have a font, give up
         if font is None:
             return None
-        
-    for size in range(start_size, min_size - 1, -4):
+
+    # Get font path safely
+    font_path = getattr(font, "path", None)
+
+    def fits(size):
         try:
-            # Get font path safely
-            font_path = getattr(font, "path", None)
             if font_path:
-                test_font = ImageFont.truetype(font_path, size)
+                test_font = _load_truetype(font_path, size)
             else:
                 # If no path, try to get a new font at this size
                 test_font = get_font(size)
                 if not test_font:
-                    continue
+                    return False
                     
-            # Get text size with this font
-            bbox = draw.textbbox((0, 0), text, font=test_font)
-            if (bbox[2] - bbox[0]) <= max_width and (bbox[3] - bbox[1]) <= max_height:
-                return size
+            # Advance width and line height are enough for the fit test; no ink box needed
+            line_height = sum(test_font.getmetrics())
+            return test_font.getlength(text) <= max_width and line_height <= max_height
         except Exception as e:
-            logging.debug(f"Error when testing font size {size}: {str(e)}")
-            continue
-            
-    return None
+            logging.debug("Error when testing font size %s: %s", size, e)
+            return False
+
+    return _largest_fitting_size(start_size, min_size, fits)
 
 def split_into_lines(text, max_lines):
-    """Split text into optimal lines for display."""
+    """Split text into optimal lines for display.
+
+    Words are packed greedily, starting a new line once a line's letters exceed
+    an even share of the text; the last allowed line takes all remaining words.
+    """
     words = text.split()
     if len(words) <= max_lines:
         return words
         
     chars_per_line = len(text) // max_lines
+    last_line = max_lines - 1
     lines = []
     current_line = []
     current_length = 0
     
+    words = iter(words)
     for word in words:
-        if current_length + len(word) > chars_per_line and len(lines) < max_lines - 1:
+        word_length = len(word)
+        if current_length + word_length > chars_per_line:
             lines.append(' '.join(current_line))
             current_line = [word]
-            current_length = len(word)
+            if len(lines) == last_line:
+                # The last line takes every remaining word
+                current_line.extend(words)
+                break
+            current_length = word_length
         else:
             current_line.append(word)
-            current_length += len(word)
+            current_length += word_length
     
-    if current_line:
-        lines.append(' '.join(current_line))
-        
+    lines.append(' '.join(current_line))
     return lines
 
 def find_font_size_for_lines(draw, lines, font, max_width, max_height, start_size=None, min_size=None):
@@ -365,99 +534,67 @@ def find_font_size_for_lines(draw, lines, font, max_width, max_height, start_siz
         start_size = int(CONFIG['OUTPUT_SIZE'] * 0.4)
     if min_size is None:
         min_size = int(CONFIG['OUTPUT_SIZE'] * 0.06)
-        
-    for size in range(start_size, min_size - 1, -4):
-        try:
-            font_path = getattr(font, "path", None)
-            if font_path:
-                test_font = ImageFont.truetype(font_path, size)
-                
-                fits = True
-                for line in lines:
-                    bbox = draw.textbbox((0, 0), line, font=test_font)
-                    if (bbox[2] - bbox[0]) > max_width:
-                        fits = False
-                        break
-                        
-                # Check total height
-                if fits:
-                    total_height = 0
-                    for line in lines:
-                        bbox = draw.textbbox((0, 0), line, font=test_font)
-                        total_height += (bbox[3] - bbox[1])
-                    
-                    # Add spacing between lines (15% of font height)
-                    line_spacing = test_font.getmetrics()[0] * 0.15
-                    total_height += line_spacing * (len(lines) - 1)
-                    
-                    if total_height <= max_height:
-                        return size
-            else:
-                # If no path attribute, try different approach
-                test_font = get_font(size)
-                if not test_font:
-                    continue
-                
-                # Test with this font
+
+    font_path = getattr(font, "path", None)
+    if not font_path:
+        # If no path attribute, find the largest size get_font can load and test with that font
+        for size in range(start_size, min_size - 1, -4):
+            test_font = get_font(size)
+            if test_font:
                 return find_font_size_for_lines(draw, lines, test_font, max_width, max_height, size, min_size)
-                
+        return None
+
+    def fits(size):
+        try:
+            test_font = _load_truetype(font_path, size)
+
+            # Short-circuit on the first line that is too wide
+            for line in lines:
+                if test_font.getlength(line) > max_width:
+                    return False
+
+            # All lines share the font's line height (ascent + descent), as in draw_multiline_text
+            line_height = sum(test_font.getmetrics())
+
+            # Add spacing between lines (15% of line height)
+            line_spacing = line_height * 0.15
+            total_height = line_height * len(lines) + line_spacing * (len(lines) - 1)
+
+            return total_height <= max_height
         except Exception as e:
-            logging.debug(f"Error when testing font size {size} for multiple lines: {str(e)}")
-            continue
-            
-    return None
+            logging.debug("Error when testing font size %s for multiple lines: %s", size, e)
+            return False
+
+    return _largest_fitting_size(start_size, min_size, fits)
 
 def draw_centered_text(draw, text, font, width, height):
     """Draw text centered both horizontally and vertically, with a slight upward adjustment."""
+    # Position vertically - move text up by adjusting vertical position
+    vertical_adjustment = height * 0.07  # Positive value moves text up
     try:
-        # Try using textbbox first which is more accurate
-        bbox = draw.textbbox((0, 0), text, font=font)
-        text_width = bbox[2] - bbox[0]
-        text_height = bbox[3] - bbox[1]
-        
-        # Center horizontally
-        x = (width - text_width) / 2
-        
-        # Position vertically - move text up by adjusting vertical position
-        vertical_adjustment = height * 0.07  # Positive value moves text up
-        y = (height - text_height) / 2 - vertical_adjustment
-        
-        draw.text((x, y), text, font=font, fill='white')
+        if getattr(font, 'path', None):
+            bbox = _measure(font.path, font.size, text)
+        else:
+            bbox = draw.textbbox((0, 0), text, font=font)
     except Exception as e:
-        logging.warning(f"Error using textbbox for text centering: {str(e)}")
-        try:
-            # Fallback to older method that works with all PIL versions
-            font_metrics = font.getmetrics()
-            ascent, descent = font_metrics
-            
-            # Estimate text size using getsize if available
-            if hasattr(font, "getsize"):
-                text_width, text_height = font.getsize(text)
-            else:
-                # Very rough estimation
-                text_width = len(text) * (font.size // 2)
-                text_height = font.size
-                
-            x = (width - text_width) / 2
-            y = (height - text_height) / 2 - height * 0.07  # 7% upward adjustment
-            
-            draw.text((x, y), text, font=font, fill='white')
-        except Exception as e2:
-            logging.error(f"Text rendering fallback also failed: {str(e2)}")
-            # Last resort - use anchor="mm" for middle-middle if supported
-            try:
-                draw.text((width / 2, height / 2), text, font=font, fill='white', anchor="mm")
-            except Exception:
-                # Very basic fallback without positioning
-                draw.text((10, height / 2), text, font=font, fill='white')
+        logging.warning("Error using textbbox for text centering: %s", e)
+        # Let PIL center the text on its middle-middle anchor instead
+        draw.text((width / 2, height / 2 - vertical_adjustment), text, font=font, fill='white', anchor="mm")
+        return
+    
+    text_width = bbox[2] - bbox[0]
+    text_height = bbox[3] - bbox[1]
+    x = (width - text_width) / 2
+    y = (height - text_height) / 2 - vertical_adjustment
+    draw.text((x, y), text, font=font, fill='white')
 
 def draw_multiline_text(draw, lines, font, width, height):
     """
     Draw multiple lines of text with proper spacing and centering, with a slight upward adjustment.
     
     This algorithm handles multilingual text rendering with the following optimizations:
-    1. Dynamic line height calculation - Each line's height is calculated individually to account
-       for different character heights in various scripts
+    1. Font-metric line height - All lines share one font, so a single ascent + descent line
+       height is used for every line and only each line's width is measured
     2. Vertical adjustment (7% upward) - Text is shifted slightly upward because visually centered
        text often appears too low due to human perception
     3. Proportional line spacing - Space between lines is 15% of line height, which has been found
@@ -473,31 +610,26 @@ def draw_multiline_text(draw, lines, font, width, height):
         height: Full height of the image
     """
     try:
-        # Calculate heights
-        line_heights = []
-        total_height = 0
-        for line in lines:
-            bbox = draw.textbbox((0, 0), line, font=font)
-            line_height = bbox[3] - bbox[1]
-            line_heights.append(line_height)
-            total_height += line_height
+        # Calculate heights once from the font metrics (ascent + descent)
+        ascent, descent = font.getmetrics()
+        line_height = ascent + descent
         
         # Add line spacing (15% of line height for better spacing with more lines)
-        line_spacing = line_heights[0] * 0.15
-        total_height += line_spacing * (len(lines) - 1)
+        line_spacing = line_height * 0.15
+        total_height = line_height * len(lines) + line_spacing * (len(lines) - 1)
         
         # Draw lines - with a 7% upward adjustment
         vertical_adjustment = height * 0.07  # Positive value moves text up
         current_y = (height - total_height) / 2 - vertical_adjustment
         
-        for i, line in enumerate(lines):
-            bbox = draw.textbbox((0, 0), line, font=font)
-            text_width = bbox[2] - bbox[0]
+        for line in lines:
+            # Only the advance width is needed for horizontal centering
+            text_width = font.getlength(line)
             x = (width - text_width) / 2
             draw.text((x, current_y), line, font=font, fill='white')
-            current_y += line_heights[i] + line_spacing
+            current_y += line_height + line_spacing
     except Exception as e:
-        logging.warning(f"Error in multiline text rendering: {str(e)}")
+        logging.warning("Error in multiline text rendering: %s", e)
         try:
             # Fallback approach - calculate positions manually
             font_metrics = font.getmetrics()
@@ -518,7 +650,7 @@ def draw_multiline_text(draw, lines, font, width, height):
                 draw.text((x, current_y), line, font=font, fill='white')
                 current_y += line_height + line_spacing
         except Exception as e2:
-            logging.error(f"Multiline text fallback rendering also failed: {str(e2)}")
+            logging.error("Multiline text fallback rendering also failed: %s", e2)
             # Last resort - join lines and use simple centered text
             try:
                 combined_text = "\n".join(lines)
@@ -9,9 +9,46 @@ Functions:
 These utilities are used throughout the logo scraping pipeline to ensure only valid, clean domains are used for logo retrieval.
 """
 
+import functools
 import re
+import sys
 from urllib.parse import urlparse
 
+# First run of characters that are not domain delimiters (; , / \ or whitespace)
+_FIRST_PART_RE = re.compile(r'[^;,/\\\s]+')
+
+# Characters stripped from domains (quotes, angle brackets, parentheses, brackets)
+_UNWANTED_RE = re.compile(r'["\'<>\(\)\[\]]')
+
+# "scheme://host..." URLs whose host (group 1) can be read without urlparse: printable
+# ASCII up to the first "/", "?" or "#", with no IPv6 brackets to validate
+_SIMPLE_URL_RE = re.compile(r'[A-Za-z][A-Za-z0-9+.-]*://([^\x00-\x20\x7f-\U0010ffff/?#\[\]]*)(?=[/?#]|\Z)')
+
+# Already-clean domains: lowercase ASCII letters, digits, dots and hyphens,
+# starting and ending with a letter or digit
+_CLEAN_DOMAIN_RE = re.compile(r'[a-z0-9](?:[a-z0-9.-]*[a-z0-9])?')
+
+def _normalize_domain(domain):
+    """Apply clean_domain's normalization steps (everything except validation)."""
+    # Remove anything before '@' (e.g. user@domain.com -> domain.com)
+    domain = domain.rpartition('@')[2]
+
+    # Use the first non-empty part between common delimiters
+    first_part = _FIRST_PART_RE.search(domain)
+    if first_part:
+        domain = first_part.group()
+
+    # Remove unwanted characters
+    domain = _UNWANTED_RE.sub('', domain)
+
+    # Remove common prefixes
+    domain = domain.lower()
+    if domain.startswith('www.'):
+        domain = domain[4:]
+
+    # Remove leading/trailing dots and hyphens and spaces
+    return domain.strip(' .-')
+
 def clean_domain(domain):
     """Clean and normalize a domain name.
     - Lowercase
@@ -22,28 +59,22 @@ def clean_domain(domain):
     - Remove leading/trailing dots and hyphens
     - Strip spaces
     - Validate minimum domain requirements
+    Non-string input (e.g. NaN from an empty DataFrame cell) yields None.
     """
-    if not domain:
+    if not isinstance(domain, str) or not domain:
         return None
+    return _clean_domain(domain)
 
-    # Remove anything before '@' (e.g. user@domain.com -> domain.com)
-    domain = domain.split('@')[-1]
-
-    # Split on common delimiters and use the first non-empty part
-    delimiters = r'[;,/\\\s]'
-    parts = [p for p in re.split(delimiters, domain) if p]
-    domain = parts[0] if parts else domain
-
-    # Remove unwanted characters
-    domain = re.sub(r'["\'<>\(\)\[\]]', '', domain)
 
-    # Remove common prefixes
-    domain = domain.lower()
-    if domain.startswith('www.'):
-        domain = domain[4:]
-
-    # Remove leading/trailing dots and hyphens and spaces
-    domain = domain.strip(' .-')
+@functools.lru_cache(maxsize=65536)
+def _clean_domain(domain):
+    """Cached implementation of clean_domain for non-empty strings."""
+    # Already-clean domains (the common case) only need the www. prefix removed
+    if _CLEAN_DOMAIN_RE.fullmatch(domain):
+        if domain.startswith('www.'):
+            domain = domain[4:].lstrip('.-')
+    else:
+        domain = _normalize_domain(domain)
 
     # Basic domain validation - must be at least 4 characters and contain a dot
     if not domain or len(domain) < 4 or '.' not in domain:
@@ -58,23 +89,38 @@ def clean_domain(domain):
     if len(parts[-1]) < 2:
         return None
 
-    return domain
+    # Interned so every occurrence of a domain is the same object, making
+    # domain-keyed dict/set lookups downstream identity comparisons
+    return sys.intern(domain)
 
 
 def get_domain_from_url(url_or_domain):
     """Extract and clean the domain from a URL or domain string.
     Handles malformed/invalid domains and multiple delimiters.
+    Non-string input (e.g. NaN from an empty DataFrame cell) yields None.
     """
-    if not url_or_domain:
+    if not isinstance(url_or_domain, str) or not url_or_domain:
         return None
+    return _get_domain_from_url(url_or_domain)
+
+
+@functools.lru_cache(maxsize=65536)
+def _get_domain_from_url(url_or_domain):
+    """Cached implementation of get_domain_from_url for non-empty strings.
+
+    Results are cached, since the same URLs recur across companies in a batch.
+    """
     # Remove anything before '@' so "user@domain.com" -> "domain.com"
-    cleaned = url_or_domain.split('@')[-1]
+    cleaned = url_or_domain.rpartition('@')[2]
     # Remove all spaces
     cleaned = cleaned.replace(' ', '')
-    # If it's a URL, extract the netloc
-    if '://' in cleaned:
+    # If it's a URL, extract the netloc; plain URLs are split directly
+    simple_url = _SIMPLE_URL_RE.match(cleaned)
+    if simple_url:
+        domain = simple_url.group(1).partition(':')[0]
+    elif '://' in cleaned:
         parsed = urlparse(cleaned)
-        domain = parsed.netloc.split(':')[0] if parsed.netloc else ''
+        domain = parsed.netloc.partition(':')[0]
     else:
         domain = cleaned
-    return clean_domain(domain)
\ No newline at end of file
+    return _clean_domain(domain) if domain else None